@@ -1,5 +1,57 @@
+import sys
 import pygame
-import pygwidgets
+
+_SURFACE_CACHE = {}
+_CARD_NAME_TABLE = {}
+
+
+def _load(path):
+    """
+    Loads an image from disk once and returns the cached surface on subsequent calls.
+
+    Only images converted to the display's pixel format with `convert_alpha()` are cached,
+    so no blit pays for a per-pixel format conversion. Before the display exists the image
+    is returned as loaded and not cached, so the next call after `set_mode` converts it.
+
+    Args:
+        path (str): Path to the image file.
+
+    Returns:
+        pygame.Surface: The loaded (and, if possible, converted) image.
+    """
+
+    surface = _SURFACE_CACHE.get(path)
+    if surface is None:
+        surface = pygame.image.load(path)
+        if pygame.display.get_surface() is None:
+            return surface
+        surface = surface.convert_alpha()
+        _SURFACE_CACHE[path] = surface
+    return surface
+
+
+def _cardNames(rank, suit):
+    """
+    Returns the card name and image file name for the given rank and suit.
+
+    Both strings are built and interned only once per (rank, suit) pair; later calls are a
+    single dict lookup.
+
+    Args:
+        rank (str): Rank of the card.
+        suit (str): Suit of the card.
+
+    Returns:
+        tuple: The card name (e.g., 'Jack of Hearts') and the path of its image file.
+    """
+
+    names = _CARD_NAME_TABLE.get((rank, suit))
+    if names is None:
+        cardName = sys.intern(rank + ' of ' + suit)
+        names = (cardName, 'images/' + cardName + '.png')
+        _CARD_NAME_TABLE[(rank, suit)] = names
+    return names
+
 
 class Card():
     """
@@ -9,20 +61,26 @@ class Card():
     It also contains utility methods to fetch its value and manage its display properties.
 
     Attributes:
-        BACK_OF_CARD_IMAGE (pygame.Surface): The image used for the back of the card.
+        BACK_OF_CARD_FILE (str): Path to the image used for the back of the card.
         window (pygame.Surface): The game window where the card will be drawn.
         rank (str): Rank of the card (e.g., 'Jack', '10').
         suit (str): Suit of the card (e.g., 'Hearts', 'Spades').
         cardName (str): Combined name of rank and suit (e.g., 'Jack of Hearts').
         value (int): Numeric value assigned to the card.
-        images (pygwidgets.ImageCollection): Collection of card images ('front' and 'back') with default
-            location of the card for display.
+        _deck (Deck): The deck the card belongs to; it holds the card images shared by all its cards
+            and tracks which of its cards are revealed.
+        _face (str): The side currently shown, 'front' or 'back'.
+        _loc (tuple): Location of the card on the game window.
+        _blitArgs (tuple): Ready-made arguments for blitting the side currently shown at _loc,
+            rebuilt whenever the card is turned over or moved.
     """
 
-    BACK_OF_CARD_IMAGE = pygame.image.load('images/Back of Card.png')
+    BACK_OF_CARD_FILE = 'images/Back of Card.png'
+
+    __slots__ = ('window', 'rank', 'suit', 'cardName', 'value', '_deck', '_face', '_loc', '_blitArgs')
 
 
-    def __init__(self, window, rank, suit, value):
+    def __init__(self, window, rank, suit, value, deck):
         """
         Initializes the Card class with essential attributes.
 
@@ -31,17 +89,18 @@ class Card():
             rank (str): Rank of the card.
             suit (str): Suit of the card.
             value (int): Numeric value assigned to the card.
+            deck (Deck): The deck the card belongs to, providing the shared card images.
         """
 
         self.window = window
         self.rank = rank
         self.suit = suit
-        self.cardName = rank + ' of ' + suit
+        self.cardName = _cardNames(rank, suit)[0]
         self.value = value
-        fileName = 'images/' + self.cardName + '.png'
-        self.images = pygwidgets.ImageCollection(window, (0, 0),
-                                {'front': fileName,
-                                 'back': Card.BACK_OF_CARD_IMAGE}, 'back')
+        self._deck = deck
+        self._face = 'back'
+        self._loc = (0, 0)
+        self._updateBlitArgs()
 
 
     def conceal(self):
@@ -49,7 +108,9 @@ class Card():
         Conceals the card by displaying its back side.
         """
 
-        self.images.replace('back')
+        self._deck._revealed.discard(self)
+        self._face = 'back'
+        self._updateBlitArgs()
 
 
     def reveal(self):
@@ -57,13 +118,18 @@ class Card():
         Reveals the card by displaying its front side.
         """
 
-        self.images.replace('front')
+        self._deck._revealed.add(self)
+        self._face = 'front'
+        self._updateBlitArgs()
 
 
     def getValue(self):
         """
         Retrieves the card's numeric value.
 
+        Kept for compatibility; code comparing cards on every round reads the `value`
+        attribute directly and skips the method call.
+
         Returns:
             int: The numeric value of the card.
         """
@@ -76,7 +142,23 @@ class Card():
         Args:
             loc (tuple): A tuple containing the x and y coordinates.
         """
-        self.images.setLoc(loc)
+        self._loc = loc
+        self._updateBlitArgs()
+
+
+    def _updateBlitArgs(self):
+        """
+        Rebuilds the arguments for blitting the currently shown side of the card.
+
+        The front is an area of the deck's atlas surface; the back is the shared back image.
+        The result, (source, dest) or (source, dest, area), is accepted by both `Surface.blit`
+        and `Surface.blits`, so drawing needs no lookups.
+        """
+
+        if self._face == 'front':
+            self._blitArgs = (self._deck._atlas, self._loc, self._deck._rects[self.cardName])
+        else:
+            self._blitArgs = (self._deck._backSurface, self._loc)
 
 
     def draw(self):
@@ -84,4 +166,17 @@ class Card():
         Draw the card on the game window.
         """
 
-        self.images.draw()
\ No newline at end of file
+        self.window.blit(*self._blitArgs)
+
+
+    @classmethod
+    def drawBatch(cls, window, cards):
+        """
+        Draw several cards on the game window with a single `Surface.blits` call.
+
+        Args:
+            window (pygame.Surface): The game window where the cards will be drawn.
+            cards (iterable): The cards to draw, in drawing order.
+        """
+
+        window.blits([oCard._blitArgs for oCard in cards], doreturn=False)
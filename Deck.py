@@ -1,5 +1,7 @@
 import random
+from types import MappingProxyType
 from Card import *
+from Card import _load, _cardNames
 
 class Deck():
     """
@@ -10,14 +12,14 @@ class Deck():
 
     Attributes:
         SUIT_TUPLE (tuple): Defines the four suits of a standard deck.
-        STANDARD_DICT (dict): Maps the rank of cards to their respective values.
+        STANDARD_DICT (types.MappingProxyType): Read-only mapping of the rank of cards to their respective values.
     """
 
     SUIT_TUPLE = ('Hearts', 'Spades', 'Diamonds', 'Clubs')
-    STANDARD_DICT = {'9': 9, '10': 10, 'Jack': 11, 'Queen': 12, 'King': 13, 'Ace': 14}
+    STANDARD_DICT = MappingProxyType({'9': 9, '10': 10, 'Jack': 11, 'Queen': 12, 'King': 13, 'Ace': 14})
 
 
-    def __init__(self, window, rankValueDict=STANDARD_DICT):
+    def __init__(self, window, rankValueDict=STANDARD_DICT, seed=None):
         """
         Initializes a new deck of cards with given rank values.
 
@@ -25,46 +27,158 @@ class Deck():
             window: The graphical window where the cards are displayed.
             rankValueDict (dict, optional): A dictionary mapping card ranks to their values.
                                             Defaults to the standard rank-to-value dictionary.
+            seed (optional): Seed for the deck's own random number generator, for reproducible
+                             shuffles. Defaults to None (seeded from the operating system).
 
         Attributes:
-            startingDeckList (list): A list of Card objects representing the initial state of the deck.
-            playingDeckList (list): A dynamic list of Card objects representing the current state of the deck.
+            window (pygame.Surface): The game window passed on to the cards of the deck.
+            nCards (int): Number of cards in the full deck.
+            halfSize (int): Number of cards in each half of the deck when it is dealt to two players.
+            _specs (list): The (rank, suit, value) of every card in the deck.
+            _cards (list): Card objects aligned with _specs; each one is created the first time it is dealt.
+            _order (list): A permutation of indices into _specs giving the current deck order.
+            _top (int): Number of cards still left in the deck; the next card dealt is `_order[_top - 1]`.
+            _atlas (pygame.Surface): A single surface holding the fronts of all cards of the deck,
+                                     one row per suit and one column per rank.
+            _rects (dict): The area of each card front within _atlas, keyed by card name.
+            _backSurface (pygame.Surface): The image of the back of the card, shared by all cards.
+            _revealed (set): Cards of the deck that are currently showing their front side.
+            _rng (random.Random): Random number generator used to shuffle this deck.
         """
 
-        self.startingDeckList = []
-        self.playingDeckList = []
+        self.window = window
+        self._specs = []
+        self._backSurface = _load(Card.BACK_OF_CARD_FILE)
+        self._revealed = set()
+        self._rng = random.Random(seed)
+        fronts = []
+        rankValueItems = tuple(rankValueDict.items())
         for suit in Deck.SUIT_TUPLE:
-            for rank, value in rankValueDict.items():
-                oCard = Card(window, rank, suit, value)
-                self.startingDeckList.append(oCard)
+            for rank, value in rankValueItems:
+                cardName, fileName = _cardNames(rank, suit)
+                fronts.append((cardName, _load(fileName)))
+                self._specs.append((rank, suit, value))
+        self._buildAtlas(fronts, len(rankValueItems))
+        self.nCards = len(self._specs)
+        self.halfSize = self.nCards // 2
+        self._cards = [None] * self.nCards
+        self._order = list(range(self.nCards))
+        self._top = self.nCards
         self.shuffle()
 
+    def _buildAtlas(self, fronts, nColumns):
+        """
+        Copies the card fronts into a single atlas surface and records where each one lies.
+
+        Args:
+            fronts (list): (cardName, surface) pairs in deck order, one suit after another.
+            nColumns (int): Number of cards per suit, i.e. the number of atlas columns.
+        """
+
+        cellWidth = max(surface.get_width() for cardName, surface in fronts)
+        cellHeight = max(surface.get_height() for cardName, surface in fronts)
+        nRows = -(-len(fronts) // nColumns)
+        # Take the pixel format from a card front, so the atlas, the fronts and the back
+        # (all loaded through _load) share one format whether or not the display exists yet
+        template = fronts[0][1]
+        self._atlas = pygame.Surface((cellWidth * nColumns, cellHeight * nRows), pygame.SRCALPHA,
+                                     template.get_bitsize(), template.get_masks())
+        self._atlas.fill((0, 0, 0, 0))
+
+        self._rects = {}
+        for i, (cardName, surface) in enumerate(fronts):
+            row, column = divmod(i, nColumns)
+            rect = surface.get_rect(topleft=(column * cellWidth, row * cellHeight))
+            # BLEND_RGBA_MAX onto the cleared atlas copies the pixels, alpha included, unchanged
+            self._atlas.blit(surface, rect, special_flags=pygame.BLEND_RGBA_MAX)
+            self._rects[cardName] = rect
+
+    @classmethod
+    def preload(cls, rankValueDict=STANDARD_DICT):
+        """
+        Loads and converts every card image once, before any deck is created.
+
+        Must be called after `pygame.display.set_mode`, so that the images can be converted
+        to the display's pixel format. Cards created afterwards take their images from the cache.
+
+        Args:
+            rankValueDict (dict, optional): A dictionary mapping card ranks to their values.
+                                            Defaults to the standard rank-to-value dictionary.
+
+        Raises:
+            ValueError: If no display exists yet, i.e. `set_mode` has not been called, so the
+                        images could not be converted.
+        """
+
+        if pygame.display.get_surface() is None:
+            raise ValueError('Karty można wczytać dopiero po utworzeniu okna gry.')
+        for suit in cls.SUIT_TUPLE:
+            for rank in rankValueDict:
+                _load(_cardNames(rank, suit)[1])
+        _load(Card.BACK_OF_CARD_FILE)
+
     def shuffle(self):
         """
         Shuffles the deck, ensuring cards are in random order and concealed.
 
-        Resets the playing deck list to a copy of the starting deck and then shuffles
-        it to ensure randomness in the card order. Also, ensures that all cards are concealed.
+        Shuffles the order of indices into the deck in place, instead of copying
+        and shuffling the Card objects, and puts every card back into the deck. Also,
+        ensures that all cards are concealed; only the revealed ones need to be turned over.
         """
-        self.playingDeckList = self.startingDeckList.copy()
-        for oCard in self.playingDeckList:
-            oCard.conceal()
-        random.shuffle(self.playingDeckList)
+        while self._revealed:
+            self._revealed.pop().conceal()
+        self._rng.shuffle(self._order)
+        self._top = self.nCards
 
     def getCard(self):
         """
         Deals and returns the top card from the deck.
 
-        Removes the top card from the playing deck list and returns it. If the deck
-        is empty, it raises an error indicating no more cards are left to be dealt.
+        Takes the card at the top of the shuffled order and returns it, creating the Card
+        object the first time that card is dealt. If the deck is empty, it raises an error
+        indicating no more cards are left to be dealt.
 
         Returns:
             Card: The top card from the deck.
 
         Raises:
-            IndexError: If there are no cards left in the playing deck list.
+            IndexError: If there are no cards left in the deck.
         """
-        if len(self.playingDeckList) == 0:
+        if self._top == 0:
             raise IndexError('Brak kolejnych kart.')
-        oCard = self.playingDeckList.pop()
+        self._top -= 1
+        return self._cardAt(self._order[self._top])
+
+    def dealAll(self, nPiles):
+        """
+        Deals all the remaining cards into the given number of piles at once.
+
+        Cards go to the piles in turn, starting from the top of the deck, exactly as repeated
+        `getCard` calls dealt alternately would, but without a method call per card.
+
+        Args:
+            nPiles (int): Number of piles to deal the cards into.
+
+        Returns:
+            list: A list of nPiles lists of Card objects; the first card dealt to a pile comes first.
+        """
+        dealtList = [self._cardAt(index) for index in reversed(self._order[:self._top])]
+        self._top = 0
+        return [dealtList[i::nPiles] for i in range(nPiles)]
+
+    def _cardAt(self, index):
+        """
+        Returns the Card object for the given index into _specs, creating it on first use.
+
+        Args:
+            index (int): Index of the card in _specs.
+
+        Returns:
+            Card: The card at that index.
+        """
+        oCard = self._cards[index]
+        if oCard is None:
+            rank, suit, value = self._specs[index]
+            oCard = Card(self.window, rank, suit, value, self)
+            self._cards[index] = oCard
         return oCard
\ No newline at end of file
@@ -1,3 +1,6 @@
+import random
+from collections import deque
+from itertools import chain
 from Deck import *
 from Text import *
 
@@ -14,6 +17,11 @@ class Game():
         CARDS_TOP (int): The top position for cards on the screen.
         CARD_OFFSET (int): The offset used to place cards relative to other cards.
         MAX_ROUND_NUMBER (int): The maximum number of rounds the game can last.
+        SLOT_POS (tuple): Screen positions of the four regular card slots: Player's hand, Player's
+            laid card, NPC's laid card and NPC's hand.
+        WAR_ROW_STRIDE (int): Vertical distance between consecutive rows of war cards.
+        WAR_SLOT_POS (tuple): (left, vertical offset) of the four card slots added by each war:
+            Player's stake and new laid card, then the NPC's. The offsets are relative to `warCardsTop`.
       """
 
     CARDS_TOP = 250
@@ -22,6 +30,11 @@ class Game():
     CARD_OFFSET = 150
     MAX_ROUND_NUMBER = 100
     N_SEEN_CARDS = 4
+    WAR_ROW_STRIDE = 30
+    SLOT_POS = ((PLAYER_CARDS_LEFT, CARDS_TOP), (PLAYER_CARDS_LEFT + CARD_OFFSET, CARDS_TOP),
+                (NPC_CARDS_LEFT, CARDS_TOP), (NPC_CARDS_LEFT + CARD_OFFSET, CARDS_TOP))
+    WAR_SLOT_POS = ((PLAYER_CARDS_LEFT + CARD_OFFSET, 0), (PLAYER_CARDS_LEFT + CARD_OFFSET, WAR_ROW_STRIDE),
+                    (NPC_CARDS_LEFT, 0), (NPC_CARDS_LEFT, WAR_ROW_STRIDE))
 
 
     def __init__(self, window):
@@ -36,7 +49,7 @@ class Game():
             oDeck (Deck): Represents the deck of cards used in the game.
             oText (Text): Utility for handling text display and interaction.
             roundNumber (int): Counter for the number of rounds played.
-            cardsSet (bool): Flag to check if the cards are set.
+            state (str): Current phase of the game: 'first', 'play', 'war' or 'stack'.
             displayedCardList (list): List of cards currently being displayed.
             specialDisplayList (list): List for any special ways to display cards.
             playerCardWrap (bool): Flag to check if player cards need wrapping.
@@ -44,31 +57,33 @@ class Game():
             playerScore (int): Score counter for the player.
             npcScore (int): Score counter for the NPC.
             warNumber (int): Counter for the number of wars triggered.
-            warMode (bool): Flag to check if the game is currently in war mode.
             anotherWar (bool): Flag for any consecutive wars.
             stack (list): List of cards involved in a war.
-            stackCardsToShow (bool): Flag to indicate if cards from the stack should be displayed.
+            gameOver (bool): Flag set once the game has ended; it is never cleared.
+            dirty (bool): Flag to indicate that the game state changed since the window was last drawn.
+            _dispatch (dict): Maps each state to the method that handles a click of the "Graj" button.
         """
 
         self.window = window
         self.oDeck = Deck(self.window)
-        self.oText = Text(self.window)
+        self.oText = Text(self.window, Game.MAX_ROUND_NUMBER, self.oDeck.nCards)
 
         self.roundNumber = 0
-        self.cardsSet = False
+        self.state = 'first'
         self.displayedCardList = []
         self.specialDisplayList = []
         self.playerCardWrap = False
         self.npcCardWrap = False
 
-        self.playerScore = len(self.oDeck.playingDeckList) // 2
-        self.npcScore = len(self.oDeck.playingDeckList) // 2
+        self.playerScore = self.npcScore = self.oDeck.halfSize
 
         self.warNumber = 0
-        self.warMode = False
         self.anotherWar = False
         self.stack = []
-        self.stackCardsToShow = False
+        self.gameOver = False
+        self.dirty = True
+        self._dispatch = {'first': self.firstView, 'war': self.war,
+                          'stack': self.showStackCards, 'play': self.gamePlay}
 
         self.dealCards()
         self.manageGame()
@@ -78,14 +93,14 @@ class Game():
         Deals cards to both player and NPC from the shuffled deck.
 
         This method shuffles the main deck and then distributes cards
-        alternately between the player and NPC. After distributing, it also
+        alternately between the player and NPC in a single `dealAll` call. After distributing, it also
         updates the on-screen text to display the current card count for
         both the player and the NPC.
 
         Attributes:
             self.oDeck: An instance of the Deck class representing the main deck.
-            self.playerCardList: List storing the cards dealt to the player.
-            self.npcCardList: List storing the cards dealt to the NPC.
+            self.playerCardList: Deque storing the cards dealt to the player; the top card is on the right.
+            self.npcCardList: Deque storing the cards dealt to the NPC; the top card is on the right.
             self.oText: An instance of the Text class used for updating on-screen text.
 
         Note:
@@ -94,44 +109,35 @@ class Game():
         """
 
         self.oDeck.shuffle()
-        self.playerCardList = []
-        self.npcCardList = []
+        playerPile, npcPile = self.oDeck.dealAll(2)
+        self.playerCardList = deque(playerPile)
+        self.npcCardList = deque(npcPile)
 
-        for i in range(len(self.oDeck.startingDeckList)):
-            if i % 2 == 0:
-                self.playerCardList.append(self.oDeck.getCard())
-            else:
-                self.npcCardList.append(self.oDeck.getCard())
-
-        self.oText.playerScoreText.setValue('Liczba kart w talii Gracza: ' + str(self.playerScore))
-        self.oText.npcScoreText.setValue('Liczba kart w talii NPC: ' + str(self.npcScore))
+        self.oText.playerScoreText.setValue(self.playerScore)
+        self.oText.npcScoreText.setValue(self.npcScore)
 
     def manageGame(self):
         """
         Manages the flow of the game based on the current game state.
 
-        This method controls the overall flow and progression of the game, deciding which
-        phase or action should be executed next based on various game conditions:
-        - Displays the initial game view if the game hasn't started.
-        - Handles the "war" scenario where both players have a card of the same value.
-        - Shows stack cards if applicable.
-        - Otherwise, proceeds with the normal gameplay.
+        This method controls the overall flow and progression of the game, calling the
+        method that handles the current state:
+        - 'first': Displays the initial game view.
+        - 'war': Handles the "war" scenario where both players have a card of the same value.
+        - 'stack': Shows stack cards.
+        - 'play': Proceeds with the normal gameplay.
+        Once the game is over, the method returns straight away without changing anything.
 
         Returns:
             bool: True if the game should end, False if it should continue.
         """
 
-        if not self.cardsSet:
-            self.firstView()
+        if self.gameOver:
+            return True
 
-        elif self.warMode:
-            return self.war()
+        self.dirty = True
 
-        elif self.stackCardsToShow:
-            return self.showStackCards()
-
-        else:
-            return self.gamePlay()
+        return self._dispatch[self.state]()
 
     def firstView(self):
         """
@@ -140,14 +146,17 @@ class Game():
             The method determines which card is currently on top of the player's and NPC's hand
             and prepares them for display. Then, it sets the position of the cards on the game
             screen. The cards' positions are based on predefined constants. Once all cards are
-            set in place, the 'cardsSet' flag is set to True, indicating that the initial card
+            set in place, the state is set to 'play', indicating that the initial card
             placement is complete.
 
             Attributes set:
                 - playerHandCard: The top card of the player's hand.
                 - npcHandCard: The top card of the NPC's hand.
                 - displayedCardList: List of cards that are currently being displayed on the screen.
-                - cardsSet: Flag indicating whether the initial card placement is done.
+                - state: Set to 'play' once the initial card placement is done.
+
+            Returns:
+                bool: Always False, the game cannot end before the first round.
             """
 
         self.playerHandCard = self.playerCardList[-1]
@@ -155,12 +164,11 @@ class Game():
 
         self.displayedCardList.extend([self.playerHandCard, self.npcHandCard])
 
-        thisLeft = Game.PLAYER_CARDS_LEFT
-        for i in range(Game.N_SEEN_CARDS // 2):
-            self.displayedCardList[i].setLoc((thisLeft, Game.CARDS_TOP))
-            thisLeft = Game.NPC_CARDS_LEFT + Game.CARD_OFFSET
-        else:
-            self.cardsSet = True
+        self.playerHandCard.setLoc(Game.SLOT_POS[0])
+        self.npcHandCard.setLoc(Game.SLOT_POS[3])
+        self.state = 'play'
+
+        return False
 
     def prepareToDisplay(self):
         """
@@ -182,11 +190,11 @@ class Game():
         self.displayedCardList = []
         self.specialDisplayList = []
 
-        for oCard in [self.playerLaidCard, self.npcLaidCard]:
-            oCard.reveal()
+        self.playerLaidCard.reveal()
+        self.npcLaidCard.reveal()
 
-        for oCard in [self.playerHandCard, self.npcHandCard]:
-            oCard.conceal()
+        self.playerHandCard.conceal()
+        self.npcHandCard.conceal()
 
         if not self.playerCardWrap and not self.npcCardWrap:
             self.displayedCardList.extend(
@@ -202,21 +210,12 @@ class Game():
         """
         Sets the display location for cards for both the player and the NPC.
 
-        This method uses predefined constants to determine the initial position
-        (PLAYER_CARDS_LEFT, NPC_CARDS_LEFT) and offsets (CARD_OFFSET) for card display.
-        It then arranges cards for both player and NPC based on the total number
-        of cards to be displayed (N_SEEN_CARDS).
+        This method places the first N_SEEN_CARDS displayed cards in the precomputed
+        regular card slots (SLOT_POS), two for the player followed by two for the NPC.
         """
 
-        thisLeft = Game.PLAYER_CARDS_LEFT
-        for i in range(Game.N_SEEN_CARDS // 2):
-            self.displayedCardList[i].setLoc((thisLeft, Game.CARDS_TOP))
-            thisLeft += Game.CARD_OFFSET
-
-        thisLeft = Game.NPC_CARDS_LEFT
-        for i in range(Game.N_SEEN_CARDS // 2, Game.N_SEEN_CARDS):
-            self.displayedCardList[i].setLoc((thisLeft, Game.CARDS_TOP))
-            thisLeft += Game.CARD_OFFSET
+        for oCard, loc in zip(self.displayedCardList[:Game.N_SEEN_CARDS], Game.SLOT_POS):
+            oCard.setLoc(loc)
 
 
     def setSpecialToDisplay(self):
@@ -237,13 +236,8 @@ class Game():
 
             self.npcLaidCard.reveal()
 
-            thisLeft = Game.PLAYER_CARDS_LEFT + Game.CARD_OFFSET
-            self.specialDisplayList[0].setLoc((thisLeft, Game.CARDS_TOP))
-
-            thisLeft = Game.NPC_CARDS_LEFT
-            for i in range(1, 3):
-                self.specialDisplayList[i].setLoc((thisLeft, Game.CARDS_TOP))
-                thisLeft += Game.CARD_OFFSET
+            for oCard, loc in zip(self.specialDisplayList, Game.SLOT_POS[1:]):
+                oCard.setLoc(loc)
 
             self.playerCardWrap = False
 
@@ -256,13 +250,8 @@ class Game():
 
             self.playerLaidCard.reveal()
 
-            thisLeft = Game.PLAYER_CARDS_LEFT
-            for i in range(2):
-                self.specialDisplayList[i].setLoc((thisLeft, Game.CARDS_TOP))
-                thisLeft += Game.CARD_OFFSET
-
-            thisLeft = Game.NPC_CARDS_LEFT
-            self.specialDisplayList[2].setLoc((thisLeft, Game.CARDS_TOP))
+            for oCard, loc in zip(self.specialDisplayList, Game.SLOT_POS[:3]):
+                oCard.setLoc(loc)
 
             self.npcCardWrap = False
 
@@ -276,28 +265,26 @@ class Game():
         round number, messages, war indications, and endgame messages are drawn when
         applicable.
         """
-        for oCard in self.specialDisplayList:
-            oCard.draw()
-
-        for oCard in self.displayedCardList:
-            oCard.draw()
+        Card.drawBatch(self.window, chain(self.specialDisplayList, self.displayedCardList))
 
-        self.oText.playerScoreText.draw()
-        self.oText.npcScoreText.draw()
-        self.oText.roundNumberText.draw()
+        textList = [self.oText.playerScoreText, self.oText.npcScoreText, self.oText.roundNumberText]
 
         if self.roundNumber > 0:
-            self.oText.messageText.draw()
+            textList.append(self.oText.messageText)
 
         if self.warNumber > 0:
-            self.oText.warNumberText.draw()
+            textList.append(self.oText.warNumberText)
 
-        if self.stackCardsToShow:
-            self.oText.stackText.draw()
+        if self.state == 'stack':
+            textList.append(self.oText.stackText)
 
-        if self.oText.gameOverText.getValue() == "Koniec gry!":
-            self.oText.gameOverText.draw()
-            self.oText.winnerText.draw()
+        if self.gameOver:
+            textList.append(self.oText.gameOverText)
+            textList.append(self.oText.winnerText)
+
+        # The text images are only re-rendered by setValue when their text changes,
+        # so each frame just blits the ready images in one call
+        Label.drawBatch(self.window, textList)
 
 
     def returnCard(self, competitorList, oCard):
@@ -308,11 +295,11 @@ class Game():
         typically after some game actions.
 
         Args:
-            competitorList (list): The list representing the card set of either the Player or NPC.
+            competitorList (deque): The deque representing the card set of either the Player or NPC.
             oCard (Card): The card object to be returned to the competitor's list.
         """
 
-        competitorList.insert(0, oCard)
+        competitorList.appendleft(oCard)
 
 
     def setScores(self):
@@ -327,9 +314,9 @@ class Game():
             The updated scores will be displayed when the `draw()` method is called.
         """
         self.playerScore = len(self.playerCardList)
-        self.oText.playerScoreText.setValue('Liczba kart w talii Gracza: ' + str(self.playerScore))
+        self.oText.playerScoreText.setValue(self.playerScore)
         self.npcScore = len(self.npcCardList)
-        self.oText.npcScoreText.setValue('Liczba kart w talii NPC: ' + str(self.npcScore))
+        self.oText.npcScoreText.setValue(self.npcScore)
 
 
     def gamePlay(self):
@@ -347,7 +334,7 @@ class Game():
         """
 
         self.roundNumber += 1
-        self.oText.roundNumberText.setValue('Runda numer : ' + str(self.roundNumber) +'/'+ str(Game.MAX_ROUND_NUMBER))
+        self.oText.roundNumberText.setValue(self.roundNumber)
 
         self.playerLaidCard = self.playerCardList.pop()
         if self.playerCardList:
@@ -362,42 +349,40 @@ class Game():
             self.npcCardWrap = True
 
 
-        if self.playerLaidCard.getValue() > self.npcLaidCard.getValue():
+        if self.playerLaidCard.value > self.npcLaidCard.value:
 
             self.returnCard(self.playerCardList, self.playerLaidCard)
             self.returnCard(self.playerCardList, self.npcLaidCard)
 
-            self.oText.messageText.setValue('Gracz wygrywa rundę')
+            self.oText.messageText.setValue(Text.PLAYER_WINS_ROUND)
 
-            if self.playerCardWrap:
-                self.playerHandCard = self.playerCardList[-2]
+            self.playerHandCard = self.playerCardList[-1]
 
 
-        elif self.playerLaidCard.getValue() < self.npcLaidCard.getValue():
+        elif self.playerLaidCard.value < self.npcLaidCard.value:
 
             self.returnCard(self.npcCardList, self.npcLaidCard)
             self.returnCard(self.npcCardList, self.playerLaidCard)
 
-            self.oText.messageText.setValue('NPC wygrywa rundę')
+            self.oText.messageText.setValue(Text.NPC_WINS_ROUND)
 
-            if self.npcCardWrap:
-                self.npcHandCard = self.npcCardList[-2]
+            self.npcHandCard = self.npcCardList[-1]
 
 
         else:
 
-            self.warMode = True
-            self.oText.messageText.setValue('       WOJNA!')
+            self.state = 'war'
+            self.oText.messageText.setValue(Text.WAR_MESSAGE)
 
 
         self.prepareToDisplay()
 
         self.setScores()
 
-        if self.warMode:
+        if self.state == 'war':
             self.warChecking()
 
-        return self.checkGameOver(self.playerCardList, self.npcCardList, self.roundNumber)
+        return self.checkGameOver()
 
 
     def war(self):
@@ -415,16 +400,15 @@ class Game():
         """
 
         if not self.anotherWar:
-            for oCard in [self.playerLaidCard, self.npcLaidCard]:
-                self.stack.append(oCard)
+            self.stack.extend((self.playerLaidCard, self.npcLaidCard))
 
         else:
             if self.warChecking():
-                return self.checkGameOver(self.playerCardList, self.npcCardList, self.roundNumber)
+                return self.checkGameOver()
 
         self.warNumber += 1
 
-        self.oText.warNumberText.setValue('Liczba wojen : ' + str(self.warNumber))
+        self.oText.warNumberText.setValue(self.warNumber)
 
         self.playerStakeCard = self.playerCardList.pop()
         self.npcStakeCard = self.npcCardList.pop()
@@ -441,19 +425,17 @@ class Game():
         else:
             self.npcCardWrap = True
 
-        for oCard in [self.playerStakeCard, self.npcStakeCard, self.playerNewLaidCard, self.npcNewLaidCard]:
-            self.stack.append(oCard)
+        self.stack.extend((self.playerStakeCard, self.npcStakeCard, self.playerNewLaidCard, self.npcNewLaidCard))
 
         self.warGraph()
 
-        if self.playerNewLaidCard.getValue() > self.npcNewLaidCard.getValue():
+        if self.playerNewLaidCard.value > self.npcNewLaidCard.value:
 
-            self.oText.messageText.setValue('Gracz wygrywa wojnę!')
+            self.oText.messageText.setValue(Text.PLAYER_WINS_WAR)
 
-            self.playerCardList = self.stack + self.playerCardList
+            self.playerCardList.extendleft(reversed(self.stack))
 
-            self.stackCardsToShow = True
-            self.warMode = False
+            self.state = 'stack'
             self.anotherWar = False
 
             self.setScores()
@@ -461,14 +443,13 @@ class Game():
             return False
 
 
-        elif self.playerNewLaidCard.getValue() < self.npcNewLaidCard.getValue():
+        elif self.playerNewLaidCard.value < self.npcNewLaidCard.value:
 
-            self.oText.messageText.setValue('NPC wygrywa wojnę!')
+            self.oText.messageText.setValue(Text.NPC_WINS_WAR)
 
-            self.npcCardList = self.stack + self.npcCardList
+            self.npcCardList.extendleft(reversed(self.stack))
 
-            self.stackCardsToShow = True
-            self.warMode = False
+            self.state = 'stack'
             self.anotherWar = False
 
             self.setScores()
@@ -477,7 +458,7 @@ class Game():
 
 
         else:
-            self.oText.messageText.setValue('ZNOWU WOJNA!')
+            self.oText.messageText.setValue(Text.ANOTHER_WAR_MESSAGE)
             self.anotherWar = True
 
             self.setScores()
@@ -499,11 +480,15 @@ class Game():
         - The display of cards gets adjusted using `setToDisplay`, `setSpecialToDisplay`, and `additionalCards`.
         """
 
-        for oCard in [self.playerHandCard, self.npcHandCard, self.playerStakeCard, self.npcStakeCard]:
-            oCard.conceal()
+        self.playerHandCard.conceal()
+        self.npcHandCard.conceal()
+        self.playerStakeCard.conceal()
+        self.npcStakeCard.conceal()
 
-        for oCard in [self.playerLaidCard, self.npcLaidCard, self.playerNewLaidCard, self.npcNewLaidCard]:
-            oCard.reveal()
+        self.playerLaidCard.reveal()
+        self.npcLaidCard.reveal()
+        self.playerNewLaidCard.reveal()
+        self.npcNewLaidCard.reveal()
 
 
         if not self.anotherWar:
@@ -528,8 +513,8 @@ class Game():
             self.displayedCardList[0] = self.playerHandCard
             self.displayedCardList[3] = self.npcHandCard
 
-            for oCard in [self.playerStakeCard, self.playerNewLaidCard, self.npcStakeCard, self.npcNewLaidCard]:
-                self.displayedCardList.append(oCard)
+            self.displayedCardList.extend((self.playerStakeCard, self.playerNewLaidCard,
+                                           self.npcStakeCard, self.npcNewLaidCard))
 
             if not self.playerCardWrap and not self.npcCardWrap:
                 self.setToDisplay()
@@ -543,53 +528,24 @@ class Game():
         """
         Adjusts the location of additional cards during the game, specifically for the war mode.
 
-        This method positions the additional cards that are used during the war mode in the game. The
-        locations of the Player's and NPC's cards are adjusted separately based on the current state
-        of the war (whether it's the first war or another subsequent war).
-
-        Attributes:
-            thisLeft: Initial left position for placing the card.
-            thisTop: Initial top position for placing the card.
+        This method positions the four cards added by the latest war (the last four displayed
+        cards) in the precomputed war slots (WAR_SLOT_POS), one row below the other. The first
+        war starts just below the regular cards; each further war continues below the previous one.
 
         Notes:
-        - The 'anotherWar' flag determines the logic branch for positioning.
+        - The 'anotherWar' flag determines whether the rows start below the regular cards or
+            below the previous war.
         - `warCardsTop` attribute keeps track of the vertical position for next card placements
             in subsequent wars.
         """
 
-        if not self.anotherWar:
-
-            thisLeft = Game.PLAYER_CARDS_LEFT + Game.CARD_OFFSET
-            thisTop = Game.CARDS_TOP + 30
-            for i in range(Game.N_SEEN_CARDS, Game.N_SEEN_CARDS + 2):
-                self.displayedCardList[i].setLoc((thisLeft, thisTop))
-                thisTop += 30
-
-            thisLeft = Game.NPC_CARDS_LEFT
-            thisTop = Game.CARDS_TOP + 30
-            for i in range(Game.N_SEEN_CARDS + 2, Game.N_SEEN_CARDS + 4):
-                self.displayedCardList[i].setLoc((thisLeft, thisTop))
-                thisTop += 30
-
-            self.warCardsTop = thisTop
-
-        else:
+        stride = Game.WAR_ROW_STRIDE
+        warCardsTop = self.warCardsTop if self.anotherWar else Game.CARDS_TOP + stride
 
-            listIter = len(self.displayedCardList)
+        for oCard, (thisLeft, rowOffset) in zip(self.displayedCardList[-4:], Game.WAR_SLOT_POS):
+            oCard.setLoc((thisLeft, warCardsTop + rowOffset))
 
-            thisLeft = Game.PLAYER_CARDS_LEFT + Game.CARD_OFFSET
-            thisTop = self.warCardsTop
-            for i in range(listIter - 4, listIter - 2):
-                self.displayedCardList[i].setLoc((thisLeft, thisTop))
-                thisTop += 30
-
-            thisLeft = Game.NPC_CARDS_LEFT
-            thisTop = self.warCardsTop
-            for i in range(listIter - 2, listIter):
-                self.displayedCardList[i].setLoc((thisLeft, thisTop))
-                thisTop += 30
-
-            self.warCardsTop = thisTop
+        self.warCardsTop = warCardsTop + 2 * stride
 
     def showStackCards(self):
         """
@@ -607,13 +563,15 @@ class Game():
         - The method utilizes the `checkGameOver` function to verify the game's status.
         """
 
+        # The stake cards lie face down until this click; the laid cards are already face up
+        # and revealing them again costs only a set insertion
         for oCard in self.stack:
             oCard.reveal()
 
-        self.stackCardsToShow = False
-        self.stack = []
+        self.state = 'play'
+        self.stack.clear()
 
-        return self.checkGameOver(self.playerCardList, self.npcCardList, self.roundNumber)
+        return self.checkGameOver()
 
 
     def warChecking(self):
@@ -632,65 +590,169 @@ class Game():
          """
 
         if len(self.playerCardList) < 2:
-            self.oText.messageText.setValue('Gracz ma zbyt mało kart by rozegrać wojnę!')
-            self.npcCardList = self.npcCardList + self.stack + self.playerCardList
-            self.playerCardList = []
+            self.oText.messageText.setValue(Text.PLAYER_CANNOT_WAR)
+            self.npcCardList.extend(self.stack)
+            self.npcCardList.extend(self.playerCardList)
+            self.playerCardList.clear()
             return True
 
         elif len(self.npcCardList) < 2:
-            self.oText.messageText.setValue('NPC ma zbyt mało kart by rozegrać wojnę!')
-            self.playerCardList = self.playerCardList + self.stack + self.npcCardList
-            self.npcCardList = []
+            self.oText.messageText.setValue(Text.NPC_CANNOT_WAR)
+            self.playerCardList.extend(self.stack)
+            self.playerCardList.extend(self.npcCardList)
+            self.npcCardList.clear()
             return True
         else:
             return False
 
 
-    def checkGameOver(self, playerCardList, npcCardList, roundNumber):
+    def checkGameOver(self):
         """
         Checks if the game is over based on specified conditions.
 
         This method evaluates the current state of the game by examining
         the card count for the Player and the NPC as well as the current round number.
-        If any of the game-over conditions are met, appropriate end-game messages are set
-        and the method returns True. Otherwise, it returns False.
-
-        Args:
-            playerCardList (list): List containing the Player's cards.
-            npcCardList (list): List containing the NPC's cards.
-            roundNumber (int): Current round number.
+        If any of the game-over conditions are met, appropriate end-game messages are set,
+        the `gameOver` flag is raised and the method returns True. Otherwise, it returns False.
 
         Returns:
             bool: True if the game is over, False otherwise.
         """
 
-        condition1 = len(npcCardList) == 0
-        condition2 = len(playerCardList) == 0
-        condition3 = roundNumber == Game.MAX_ROUND_NUMBER
+        nPlayerCards = len(self.playerCardList)
+        nNpcCards = len(self.npcCardList)
 
-        if condition1:
-            self.oText.gameOverText.setValue('Koniec gry!')
-            self.oText.winnerText.setValue('Gracz wygrywa grę!')
+        if nNpcCards == 0:
+            self.gameOver = True
+            self.oText.winnerText.setValue(Text.PLAYER_WINS_GAME)
             return True
 
-        elif condition2:
-            self.oText.gameOverText.setValue('Koniec gry!')
-            self.oText.winnerText.setValue('NPC wygrywa grę!')
+        elif nPlayerCards == 0:
+            self.gameOver = True
+            self.oText.winnerText.setValue(Text.NPC_WINS_GAME)
             return True
 
-        elif condition3:
-            self.oText.gameOverText.setValue('Koniec gry!')
-            self.oText.messageText.setValue('Osiągnięto maksymalną liczbę rund')
+        elif self.roundNumber == Game.MAX_ROUND_NUMBER:
+            self.gameOver = True
+            self.oText.messageText.setValue(Text.MAX_ROUNDS_REACHED)
 
-            if len(playerCardList) > len(npcCardList):
-                self.oText.winnerText.setValue('Gracz wygrywa grę!')
+            if nPlayerCards > nNpcCards:
+                self.oText.winnerText.setValue(Text.PLAYER_WINS_GAME)
                 return True
 
-            elif len(playerCardList) < len(npcCardList):
-                self.oText.winnerText.setValue('NPC wygrywa grę!')
+            elif nPlayerCards < nNpcCards:
+                self.oText.winnerText.setValue(Text.NPC_WINS_GAME)
                 return True
             else:
-                self.oText.winnerText.setValue('Remis!')
+                self.oText.winnerText.setValue(Text.DRAW_MESSAGE)
                 return True
         else:
-            return False
\ No newline at end of file
+            return False
+
+
+    @classmethod
+    def simulateHeadless(cls, seed=None, rankValueDict=Deck.STANDARD_DICT):
+        """
+        Plays a whole game without any Card objects, display or text updates.
+
+        Intended for estimating win rates over many games: only the card values are shuffled,
+        dealt alternately and played with `playHeadless`.
+
+        Args:
+            seed (optional): Seed for the shuffle, for reproducible games. Defaults to None.
+            rankValueDict (dict, optional): A dictionary mapping card ranks to their values.
+                                            Defaults to the standard rank-to-value dictionary.
+
+        Returns:
+            tuple: (Player's card count, NPC's card count, number of rounds, number of wars)
+                at the end of the game.
+        """
+
+        valueList = [value for suit in Deck.SUIT_TUPLE for value in rankValueDict.values()]
+        random.Random(seed).shuffle(valueList)
+        return cls.playHeadless(valueList[0::2], valueList[1::2])
+
+
+    @classmethod
+    def playHeadless(cls, playerValues, npcValues):
+        """
+        Plays a whole game on card values alone, following the same rules as `manageGame`.
+
+        Each round mirrors `gamePlay`, each war mirrors `war` and `warChecking`, and the game
+        ends under the same conditions as in `checkGameOver`, so the outcome is the one the
+        windowed game would reach with the same hands.
+
+        Args:
+            playerValues (list): Values of the Player's cards; the last one is the top card.
+            npcValues (list): Values of the NPC's cards; the last one is the top card.
+
+        Returns:
+            tuple: (Player's card count, NPC's card count, number of rounds, number of wars)
+                at the end of the game.
+        """
+
+        playerCardList = deque(playerValues)
+        npcCardList = deque(npcValues)
+        roundNumber = 0
+        warNumber = 0
+
+        # Bound methods and the round limit are looked up once, not on every round
+        maxRoundNumber = cls.MAX_ROUND_NUMBER
+        playerPop = playerCardList.pop
+        npcPop = npcCardList.pop
+        playerAppendLeft = playerCardList.appendleft
+        npcAppendLeft = npcCardList.appendleft
+
+        while True:
+            roundNumber += 1
+            playerValue = playerPop()
+            npcValue = npcPop()
+
+            if playerValue > npcValue:
+                playerAppendLeft(playerValue)
+                playerAppendLeft(npcValue)
+
+            elif playerValue < npcValue:
+                npcAppendLeft(npcValue)
+                npcAppendLeft(playerValue)
+
+            elif len(playerCardList) < 2:
+                npcCardList.extend(playerCardList)
+                playerCardList.clear()
+
+            elif len(npcCardList) < 2:
+                playerCardList.extend(npcCardList)
+                npcCardList.clear()
+
+            elif roundNumber != maxRoundNumber:
+                stack = [playerValue, npcValue]
+                while True:
+                    warNumber += 1
+                    playerStakeValue = playerPop()
+                    npcStakeValue = npcPop()
+                    playerValue = playerPop()
+                    npcValue = npcPop()
+                    stack.extend((playerStakeValue, npcStakeValue, playerValue, npcValue))
+
+                    if playerValue > npcValue:
+                        playerCardList.extendleft(reversed(stack))
+                        break
+
+                    elif playerValue < npcValue:
+                        npcCardList.extendleft(reversed(stack))
+                        break
+
+                    elif len(playerCardList) < 2:
+                        npcCardList.extend(stack)
+                        npcCardList.extend(playerCardList)
+                        playerCardList.clear()
+                        break
+
+                    elif len(npcCardList) < 2:
+                        playerCardList.extend(stack)
+                        playerCardList.extend(npcCardList)
+                        npcCardList.clear()
+                        break
+
+            if not playerCardList or not npcCardList or roundNumber == maxRoundNumber:
+                return len(playerCardList), len(npcCardList), roundNumber, warNumber
\ No newline at end of file
@@ -11,7 +11,9 @@ Usage:
 
 """
 
+import pygame
 from pygame.locals import *
+import pygwidgets
 import sys
 from Game import *
 
@@ -25,7 +27,16 @@ pygame.init()
 clock = pygame.time.Clock()
 window = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
 
+# Only queue the events the game reacts to: quitting, the Escape key, the buttons (which also
+# follow the mouse for their rollover look) and the window being exposed or (de)activated,
+# which asks for a redraw. Everything else is dropped by SDL before it reaches Python.
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([QUIT, KEYDOWN, MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEMOTION,
+                          VIDEOEXPOSE, ACTIVEEVENT])
+
 # Load resources: images and buttons
+Deck.preload()
+
 background = pygwidgets.Image(window, (0, 0), 'images/Background.jpg')
 
 playButton = pygwidgets.TextButton(window, (200, 600), 'Graj', width=100, height=45)
@@ -34,36 +45,77 @@ quitButton = pygwidgets.TextButton(window, (880, 600), 'Koniec', width=100, heig
 
 # Initialize the Game object
 oGame = Game(window)
+gameOver = False
+
+# The background, cards and texts only change with the game state. They are composed into
+# sceneSurface once per change; other redraws (button rollover, window exposure) restore
+# them from it and only draw the buttons on top.
+sceneSurface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+buttonRectList = [playButton.getRect(), quitButton.getRect()]
 
 # Main game loop
 while True:
 
+    # The whole window only needs redrawing after a change in the game state or when it has
+    # been exposed or restored; other events (mouse, keys) can only change the buttons.
+    # Idle frames skip drawing altogether
+    redraw = False
+    redrawButtons = False
+
+    # While the window is minimized nothing is visible, so instead of polling every frame
+    # sleep until the next event (e.g. the window being restored) arrives
+    eventList = pygame.event.get()
+    if not eventList and not pygame.display.get_active():
+        eventList = [pygame.event.wait()]
+
     # Event handling
-    for event in pygame.event.get():
+    for event in eventList:
+        if event.type in (VIDEOEXPOSE, ACTIVEEVENT):
+            redraw = True
+        else:
+            redrawButtons = True
+
         if ((event.type == QUIT) or
                 ((event.type == KEYDOWN) and (event.key == K_ESCAPE)) or
                 (quitButton.handleEvent(event))):
             pygame.quit()
             sys.exit()
 
-        if playButton.handleEvent(event):
+        # The button still sees every event, so it keeps its look, but a finished game
+        # is not asked to play on
+        if playButton.handleEvent(event) and not gameOver:
             gameOver = oGame.manageGame()
 
             if gameOver:
                 playButton.disable()
 
-    # Draw background
-    background.draw()
-
-    # Draw game elements
-    oGame.draw()
-
-    # Draw other UI components
-    playButton.draw()
-    quitButton.draw()
-
-    # Update the window
-    pygame.display.update()
+    if redraw or oGame.dirty:
+        if oGame.dirty:
+            # Draw background
+            background.draw()
+
+            # Draw game elements
+            oGame.draw()
+
+            sceneSurface.blit(window, (0, 0))
+            oGame.dirty = False
+        else:
+            window.blit(sceneSurface, (0, 0))
+
+        # Draw other UI components
+        playButton.draw()
+        quitButton.draw()
+
+        # Update the window
+        pygame.display.update()
+
+    elif redrawButtons:
+        # Restore the scene under the buttons only, and push just those areas to the screen
+        for buttonRect in buttonRectList:
+            window.blit(sceneSurface, buttonRect, buttonRect)
+        playButton.draw()
+        quitButton.draw()
+        pygame.display.update(buttonRectList)
 
     # Limit the frame rate
     clock.tick(FRAMES_PER_SECOND)
\ No newline at end of file
@@ -1,4 +1,320 @@
-import pygwidgets
+from functools import lru_cache
+import pygame
+
+_FONT_CACHE = {}
+_DIGIT_GLYPHS = {}
+
+
+def _getFont(fontSize):
+    """
+    Returns the default font in the given size, opening it only once.
+
+    All labels of the same size share one font object, and with it the glyph cache kept by
+    the font renderer and the digit glyphs of `_digitGlyphs`.
+
+    Args:
+        fontSize (int): Size of the font.
+
+    Returns:
+        pygame.font.Font: The default font in that size.
+    """
+
+    font = _FONT_CACHE.get(fontSize)
+    if font is None:
+        font = pygame.font.Font(None, fontSize)
+        _FONT_CACHE[fontSize] = font
+    return font
+
+
+def _convert(surface):
+    """
+    Converts a rendered text image to the display's pixel format, if the display exists.
+
+    Images that are blitted again and again are converted once with `convert_alpha()`, so
+    no blit pays for a per-pixel format conversion. Before `set_mode` the image is returned
+    as rendered.
+
+    Args:
+        surface (pygame.Surface): The rendered image.
+
+    Returns:
+        pygame.Surface: The converted (if possible) image.
+    """
+
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha()
+
+
+def _digitGlyphs(font, textColor):
+    """
+    Returns the images of the digits 0-9 in the given font and color, rendering them only once.
+
+    Args:
+        font (pygame.font.Font): Font of the digits.
+        textColor (tuple): RGB color of the digits.
+
+    Returns:
+        tuple: Ten surfaces; the image of digit d is at index d.
+    """
+
+    glyphs = _DIGIT_GLYPHS.get((font, textColor))
+    if glyphs is None:
+        glyphs = tuple(_convert(font.render(digit, True, textColor)) for digit in '0123456789')
+        _DIGIT_GLYPHS[(font, textColor)] = glyphs
+    return glyphs
+
+
+@lru_cache(maxsize=256)
+def _renderNumber(font, value, textColor):
+    """
+    Composes the image of a number from digit glyphs, reusing the image if it was composed before.
+
+    The digits are blitted one after another from the glyphs of `_digitGlyphs`, so no number
+    ever goes through the font renderer. The counters only ever show small numbers (card counts,
+    round and war numbers), so after the first game nearly every update is answered from the
+    cache. The returned surface is shared and must not be drawn on.
+
+    Args:
+        font (pygame.font.Font): Font used for the digits.
+        value (int): The non-negative number to compose.
+        textColor (tuple): RGB color of the digits.
+
+    Returns:
+        pygame.Surface: The image of the number.
+    """
+
+    glyphs = _digitGlyphs(font, textColor)
+    digitImages = [glyphs[int(digit)] for digit in str(value)]
+    image = pygame.Surface((sum(glyph.get_width() for glyph in digitImages), glyphs[0].get_height()),
+                           pygame.SRCALPHA)
+    x = 0
+    for glyph in digitImages:
+        image.blit(glyph, (x, 0))
+        x += glyph.get_width()
+    return image
+
+
+class Label():
+    """
+    Displays a single line of text on the game window.
+
+    A lightweight replacement for pygwidgets.DisplayText: the text is rendered straight with
+    pygame.font, and only when it changes. The label is drawn with its top left corner at `loc`,
+    which is also where a single-line DisplayText puts it, whatever its justification.
+
+    The game switches its labels between a handful of fixed messages, so every text is rendered
+    only the first time it is shown; switching back to it later reuses the stored image.
+
+    Attributes:
+        window (pygame.Surface): The game window where the label will be displayed.
+        loc (tuple): Location of the top left corner of the label on the game window.
+        font (pygame.font.Font): Font used to render the label.
+        textColor (tuple): RGB color of the text.
+        value: The value currently displayed.
+        textImage (pygame.Surface): The rendered label.
+        _images (dict): Images of the values shown so far, keyed by value.
+        _blitArgs (tuple): Ready-made (textImage, loc) arguments for blitting the label,
+            rebuilt whenever its image changes.
+    """
+
+    __slots__ = ('window', 'loc', 'font', 'textColor', 'value', 'textImage', '_images', '_blitArgs')
+
+
+    def __init__(self, window, loc, value='', fontSize=18, textColor=(0, 0, 0), image=None):
+        """
+        Initializes the label and renders its initial text.
+
+        Args:
+            window (pygame.Surface): The game window where the label will be displayed.
+            loc (tuple): Location of the top left corner of the label on the game window.
+            value (str, optional): The initial text. Defaults to no text.
+            fontSize (int, optional): Size of the font. Defaults to 18.
+            textColor (tuple, optional): RGB color of the text. Defaults to black.
+            image (pygame.Surface, optional): A ready-made initial image, shown instead of
+                rendering `value`; the label then has no value until the first `setValue`.
+        """
+
+        self.window = window
+        self.loc = loc
+        self.font = _getFont(fontSize)
+        self.textColor = textColor
+        self.value = None
+        self._images = {}
+        if image is None:
+            self.setValue(value)
+        else:
+            self._setImage(image)
+
+    def setValue(self, value):
+        """
+        Sets the text to display, rendering it only if it has not been shown before.
+
+        Args:
+            value (str): The text to display.
+        """
+
+        if value == self.value:
+            return
+        self.value = value
+        textImage = self._images.get(value)
+        if textImage is None:
+            textImage = self._storeImage(value)
+        self._setImage(textImage)
+
+    def preload(self, valueList):
+        """
+        Renders values the label will show later, so that showing them needs no rendering.
+
+        Args:
+            valueList (iterable): The values to render in advance.
+        """
+
+        for value in valueList:
+            if value not in self._images:
+                self._storeImage(value)
+
+    def _storeImage(self, value):
+        """
+        Renders the image of the given value and keeps it for later.
+
+        Args:
+            value: The value to render.
+
+        Returns:
+            pygame.Surface: The image of the value.
+        """
+
+        textImage = self._render(value)
+        self._images[value] = textImage
+        return textImage
+
+    def _render(self, value):
+        """
+        Renders the image of the given value.
+
+        Args:
+            value (str): The text to render.
+
+        Returns:
+            pygame.Surface: The image of the text.
+        """
+
+        return _convert(self.font.render(value, True, self.textColor))
+
+    def _setImage(self, textImage):
+        """
+        Shows the given image and rebuilds the blit arguments for it.
+
+        Args:
+            textImage (pygame.Surface): The new image of the label.
+        """
+
+        self.textImage = textImage
+        self._blitArgs = (textImage, self.loc)
+
+    def getValue(self):
+        """
+        Returns the value currently displayed.
+
+        Returns:
+            The displayed value.
+        """
+        return self.value
+
+    def getTextImage(self):
+        """
+        Returns the rendered label.
+
+        Returns:
+            pygame.Surface: The image of the label.
+        """
+        return self.textImage
+
+    def draw(self):
+        """
+        Draws the label on the game window.
+        """
+
+        self.window.blit(*self._blitArgs)
+
+
+    @classmethod
+    def drawBatch(cls, window, labels):
+        """
+        Draw several labels on the game window with a single `Surface.blits` call.
+
+        Args:
+            window (pygame.Surface): The game window where the labels will be drawn.
+            labels (iterable): The labels to draw, in drawing order.
+        """
+
+        window.blits([oLabel._blitArgs for oLabel in labels], doreturn=False)
+
+
+class CounterText(Label):
+    """
+    Displays a number between a fixed prefix and suffix, e.g. 'Runda numer : 12/100'.
+
+    The fixed parts of the label are rendered only once, when the counter is created. Showing
+    a number for the first time composes it from cached digit images and pastes it between the
+    prefix and suffix images; the composed label is kept, so showing that number again is a
+    dict lookup.
+
+    Attributes:
+        prefixImage (pygame.Surface): Rendered text shown before the number.
+        suffixImage (pygame.Surface): Rendered text shown after the number.
+        value (int): The number currently displayed, or None before the first `setValue`.
+    """
+
+    __slots__ = ('prefixImage', 'suffixImage')
+
+
+    def __init__(self, window, loc, prefix, suffix='', fontSize=18, textColor=(0, 0, 0)):
+        """
+        Initializes the counter and renders its prefix, suffix and digit glyphs.
+
+        Args:
+            window (pygame.Surface): The game window where the counter will be displayed.
+            loc (tuple): Location of the top left corner of the counter on the game window.
+            prefix (str): Text shown before the number.
+            suffix (str, optional): Text shown after the number. Defaults to no text.
+            fontSize (int, optional): Size of the font. Defaults to 18.
+            textColor (tuple, optional): RGB color of the text. Defaults to black.
+        """
+
+        font = _getFont(fontSize)
+        self.prefixImage = _convert(font.render(prefix, True, textColor))
+        self.suffixImage = _convert(font.render(suffix, True, textColor))
+        _digitGlyphs(font, textColor)
+        # No number is shown until the first setValue; until then the label is just the prefix
+        super().__init__(window, loc, fontSize=fontSize, textColor=textColor, image=self.prefixImage)
+
+    def _render(self, value):
+        """
+        Composes the image of the label for the given number.
+
+        The number is taken from `_renderNumber` and pasted between the prefix and suffix images.
+        Like any label, the counter keeps the composed image, so showing a number again costs
+        no allocation and no blits.
+
+        Args:
+            value (int): The number to show.
+
+        Returns:
+            pygame.Surface: The image of the prefix, number and suffix.
+        """
+
+        valueImage = _renderNumber(self.font, value, self.textColor)
+        prefixWidth = self.prefixImage.get_width()
+        valueWidth = valueImage.get_width()
+        textImage = pygame.Surface((prefixWidth + valueWidth + self.suffixImage.get_width(),
+                                    self.prefixImage.get_height()), pygame.SRCALPHA)
+        textImage.blit(self.prefixImage, (0, 0))
+        textImage.blit(valueImage, (prefixWidth, 0))
+        textImage.blit(self.suffixImage, (prefixWidth + valueWidth, 0))
+        return _convert(textImage)
+
 
 class Text():
     """
@@ -9,52 +325,82 @@ class Text():
     to provide feedback and updates to the Player.
 
     Attributes:
+        PLAYER_WINS_ROUND, NPC_WINS_ROUND, WAR_MESSAGE, PLAYER_WINS_WAR, NPC_WINS_WAR,
+        ANOTHER_WAR_MESSAGE, PLAYER_CANNOT_WAR, NPC_CANNOT_WAR, MAX_ROUNDS_REACHED (str):
+            The messages shown by messageText.
+        PLAYER_WINS_GAME, NPC_WINS_GAME, DRAW_MESSAGE (str): The results shown by winnerText.
+        MESSAGE_TUPLE (tuple): The round and war outcome messages, rendered in advance.
+        WINNER_TUPLE (tuple): The possible results of the game, rendered in advance.
         window (pygame.Surface): The game window where text elements will be displayed.
-        playerScoreText (pygwidgets.DisplayText): Text displaying the Player's remaining card count.
-        npcScoreText (pygwidgets.DisplayText): Text displaying the NPC's remaining card count.
-        roundNumberText (pygwidgets.DisplayText): Text displaying the current round number.
-        warNumberText (pygwidgets.DisplayText): Text displaying the number of wars triggered.
-        messageText (pygwidgets.DisplayText): Text displaying round outcome information.
-        stackText (pygwidgets.DisplayText): Text instructing the Player to reveal stack cards.
-        gameOverText (pygwidgets.DisplayText): Text displaying game over information.
-        winnerText (pygwidgets.DisplayText): Text displaying the winner of the game.
+        playerScoreText (CounterText): Counter displaying the Player's remaining card count.
+        npcScoreText (CounterText): Counter displaying the NPC's remaining card count.
+        roundNumberText (CounterText): Counter displaying the current round number.
+        warNumberText (CounterText): Counter displaying the number of wars triggered.
+        messageText (Label): Text displaying round outcome information.
+        stackText (Label): Text instructing the Player to reveal stack cards.
+        gameOverText (Label): Text displaying game over information; like stackText,
+            it is rendered once and only its visibility changes.
+        winnerText (Label): Text displaying the winner of the game.
         """
 
+    PLAYER_WINS_ROUND = 'Gracz wygrywa rundę'
+    NPC_WINS_ROUND = 'NPC wygrywa rundę'
+    WAR_MESSAGE = '       WOJNA!'
+    PLAYER_WINS_WAR = 'Gracz wygrywa wojnę!'
+    NPC_WINS_WAR = 'NPC wygrywa wojnę!'
+    ANOTHER_WAR_MESSAGE = 'ZNOWU WOJNA!'
+    PLAYER_CANNOT_WAR = 'Gracz ma zbyt mało kart by rozegrać wojnę!'
+    NPC_CANNOT_WAR = 'NPC ma zbyt mało kart by rozegrać wojnę!'
+    MAX_ROUNDS_REACHED = 'Osiągnięto maksymalną liczbę rund'
+    PLAYER_WINS_GAME = 'Gracz wygrywa grę!'
+    NPC_WINS_GAME = 'NPC wygrywa grę!'
+    DRAW_MESSAGE = 'Remis!'
 
-    def __init__(self, window):
+    MESSAGE_TUPLE = (PLAYER_WINS_ROUND, NPC_WINS_ROUND, WAR_MESSAGE, PLAYER_WINS_WAR, NPC_WINS_WAR,
+                     ANOTHER_WAR_MESSAGE, PLAYER_CANNOT_WAR, NPC_CANNOT_WAR, MAX_ROUNDS_REACHED)
+    WINNER_TUPLE = (PLAYER_WINS_GAME, NPC_WINS_GAME, DRAW_MESSAGE)
+
+
+    def __init__(self, window, maxRoundNumber, nCards):
         """
         Initializes the Text class for displaying in-game information and updates.
 
         Args:
             window (pygame.Surface): The game window where text elements will be displayed.
+            maxRoundNumber (int): The maximum number of rounds, shown after the current round number.
+            nCards (int): Number of cards in the deck, the highest card count a player can reach.
         """
 
         self.window = window
 
-        self.playerScoreText = pygwidgets.DisplayText(window, (130, 200),
-                                                       'Liczba kart w talii Gracza:',
-                                                       fontSize=30, textColor=(255, 255, 0),
-                                                       justified='left')
+        self.playerScoreText = CounterText(window, (130, 200), 'Liczba kart w talii Gracza: ',
+                                           fontSize=30, textColor=(255, 255, 0))
+
+        self.npcScoreText = CounterText(window, (650, 200), 'Liczba kart w talii NPC: ',
+                                        fontSize=30, textColor=(255, 255, 0))
 
-        self.npcScoreText = pygwidgets.DisplayText(window, (650, 200),
-                                                       'Liczba kart NPC: ' ,
-                                                       fontSize=30, textColor=(255, 255, 0),
-                                                       justified='right')
+        self.roundNumberText = CounterText(window, (200, 75), 'Runda numer : ', f'/{maxRoundNumber}',
+                                           fontSize=28, textColor=(255, 255, 0))
 
-        self.roundNumberText = pygwidgets.DisplayText(window, (200, 75), 'Runda numer: ', fontSize=28,
-                                                       textColor=(255, 255, 0), justified='center')
+        self.warNumberText = CounterText(window, (600, 75), 'Liczba wojen : ',
+                                         fontSize=28, textColor=(255, 255, 0))
 
-        self.warNumberText = pygwidgets.DisplayText(window, (600, 75), 'Liczba wojen: ', fontSize=28,
-                                                       textColor=(255, 255, 0), justified='center')
+        self.messageText = Label(window, (400, 500), 'Informacja o wygranej rundzie ', fontSize=32,
+                                 textColor=(255, 255, 0))
 
-        self.messageText = pygwidgets.DisplayText(window, (400, 500), 'Informacja o wygranej rundzie ', fontSize=32,
-                                                       textColor=(255, 255, 0), justified='center')
+        self.stackText = Label(window, (340, 550), 'Naciśnięcie "Graj" odkryje karty-stawki ', fontSize=30,
+                               textColor=(255, 255, 0))
 
-        self.stackText = pygwidgets.DisplayText(window, (340, 550), 'Naciśnięcie "Graj" odkryje karty-stawki ', fontSize=30,
-                                                       textColor=(255, 255, 0), justified='center')
 
+        self.gameOverText = Label(window, (400, 600), 'Koniec gry!', fontSize=50,
+                                  textColor=(255, 255, 0))
+        self.winnerText = Label(window, (400, 130), 'Gracz wygrywa! ', fontSize=50,
+                                textColor=(255, 255, 0))
 
-        self.gameOverText = pygwidgets.DisplayText(window, (400, 600), 'Info o zakończeniu gry!', fontSize=50,
-                                                       textColor=(255, 255, 0), justified='center')
-        self.winnerText = pygwidgets.DisplayText(window, (400, 130), 'Gracz wygrywa! ', fontSize=50,
-                                                       textColor=(255, 255, 0), justified='center')
\ No newline at end of file
+        # Render every fixed message and every reachable card count and round number up front,
+        # so no text is rendered during play
+        self.messageText.preload(Text.MESSAGE_TUPLE)
+        self.winnerText.preload(Text.WINNER_TUPLE)
+        self.playerScoreText.preload(range(nCards + 1))
+        self.npcScoreText.preload(range(nCards + 1))
+        self.roundNumberText.preload(range(1, maxRoundNumber + 1))